@@ -9,6 +9,7 @@ Custom Wrapper for python curses.
 import traceback
 import atexit
 import time
+import math
 import curses
 import textwrap
 from types import SimpleNamespace
@@ -497,18 +498,20 @@ class Window:
                 for idx in range(bot, bot+cnt):
                     self.scr.addch(self.head.view_cnt, idx, curses.ACS_HLINE, curses.A_REVERSE)
 
-        self.scr.refresh()
+        # stage the screen and pads; then write the frame in one update
+        self.scr.noutrefresh()
 
         if self.rows > 0:
             last_row = min(self.head.view_cnt, self.rows)-1
             if last_row >= 0:
-                self.head.pad.refresh(0, 0, 0, indent, last_row, self.cols-1)
+                self.head.pad.noutrefresh(0, 0, 0, indent, last_row, self.cols-1)
 
         if self.body_base < self.rows:
             if self.pick_mode:
                 self.highlight_picked()
-            self.body.pad.refresh(self.scroll_pos, 0,
+            self.body.pad.noutrefresh(self.scroll_pos, 0,
                   self.body_base, indent, self.rows-1, self.cols-1)
+        curses.doupdate()
 
 
     def answer(self, prompt='Type string [then Enter]', seed='', width=80):
@@ -575,22 +578,31 @@ class Window:
         Textbox(win).edit(mod_key).strip()
         return
 
-    def clear(self):
-        """Clear in prep for new screen"""
-        self.scr.clear()
-        self.head.pad.clear()
-        self.body.pad.clear()
+    def clear(self, full=True):
+        """Clear in prep for new screen. Unless full, just erase so that
+        curses repaints only the cells that differ from the last screen."""
+        if full:
+            self.scr.clear()
+        else:
+            self.scr.erase()
+        self.head.pad.erase()
+        self.body.pad.erase()
         self.head.texts, self.body.texts, self.last_pick_pos = [], [], -1
         self.head.row_cnt = self.body.row_cnt = 0
 
     def prompt(self, seconds=1.0):
         """Here is where we sleep waiting for commands or timeout"""
         ctl_b, ctl_d, ctl_f, ctl_u = 2, 4, 6, 21
-        elapsed = 0.0
-        while elapsed < seconds:
+        # wait against a deadline (not by counting timeouts) and shorten
+        # the last getch() timeout so we do not overshoot by a whole tick
+        deadline = time.monotonic() + seconds
+        while True:
+            remaining_ms = math.ceil((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+            self.scr.timeout(min(remaining_ms, self.timeout_ms))
             key = self.scr.getch()
             if key == curses.ERR:
-                elapsed += self.timeout_ms / 1000
                 continue
             if key in (curses.KEY_RESIZE, ) or curses.is_term_resized(self.rows, self.cols):
                 # self.scr.erase()
@@ -10,58 +10,102 @@ memfo is a viewer for /proc/meminfo
 
 import sys
 import os
-import re
 import traceback
-import configparser
 import time
 import shutil
-import curses
-from datetime import datetime
-from types import SimpleNamespace
-from memfo.PowerWindow import Window , OptionSpinner
+import operator
+from array import array
+from functools import lru_cache
+from bisect import bisect_right
+from itertools import islice, repeat
 
+# placeholders filled in by MemFo.start_curses(); --dump never needs them
+curses = Window = OptionSpinner = None
+
+NS_PER_SEC = 1000*1000*1000
+_K_STAR, _K_DASH, _K_R, _K_U, _K_QUEST, _K_E = map(ord, '*-ru?e')
+_K_LF = 10 # ENTER as seen by getch() in cbreak mode
+_MONO = 0  # index of the '_mono' timestamp (ns) in each info
 
 ##############################################################################
+_AGO_BUCKETS = ( # (big unit secs, big unit, small unit secs, small unit)
+    (60, 'm', 1, 's'),
+    (60*60, 'h', 60, 'm'),
+    (24*60*60, 'd', 60*60, 'h'),
+    (7*24*60*60, 'w', 24*60*60, 'd'),
+    (52*7*24*60*60, 'y', 7*24*60*60, 'w'),
+)
+# the top of each bucket (but the last) is the big unit of the next
+_AGO_LIMITS = tuple(bucket[0] for bucket in _AGO_BUCKETS[1:])
+
 def ago_str(delta_secs, signed=False):
     """ Turn time differences in seconds to a compact representation;
     ¦   e.g., '18h·39m'
     """
     ago = int(max(0, round(delta_secs if delta_secs >= 0 else -delta_secs)))
-    divs = (60, 60, 24, 7, 52, 9999999)
-    units = ('s', 'm', 'h', 'd', 'w', 'y')
-    vals = (ago%60, int(ago/60)) # seed with secs, mins (step til 2nd fits)
-    uidx = 1 # best units
-    for div in divs[1:]:
-        # print('vals', vals, 'div', div)
-        if vals[1] < div:
-            break
-        vals = (vals[1]%div, int(vals[1]/div))
-        uidx += 1
-    rv = '-' if signed and delta_secs < 0 else ''
-    rv += f'{vals[1]}{units[uidx]}' if vals[1] else ''
-    rv += f'{vals[0]:d}{units[uidx-1]}'
+    return _ago_str(ago, bool(signed and delta_secs < 0))
+
+@lru_cache(maxsize=1024)
+def _ago_str(ago, negative):
+    """ ago_str() of whole non-negative seconds (memoized) """
+    big, big_unit, small, small_unit = _AGO_BUCKETS[bisect_right(_AGO_LIMITS, ago)]
+    hi, lo = divmod(ago, big)
+    rv = '-' if negative else ''
+    rv += f'{hi}{big_unit}' if hi else ''
+    rv += f'{lo//small:d}{small_unit}'
     return rv
 
 
 ##############################################################################
 ##   human()
+_HUMAN_UNITS = ((1<<10, 'K'), (1<<20, 'M'), (1<<30, 'G'), (1<<40, 'T'))
+
+@lru_cache(maxsize=2048)
 def human(number):
     """ Return a concise number description."""
     if number < 0:
         return '-' + human(-number)
-    suffixes = ['K', 'M', 'G', 'T']
-    while suffixes:
-        suffix = suffixes.pop(0)
-        number /= 1024
-        if number < 999.95 or not suffixes:
-            return f'{number:.1f}{suffix}'
-    return '' # impossible, but make pylint happy
+    # the bit length picks the unit (at least 1 of it); bump to the next
+    # unit if the value would show as 1000.0 or more
+    idx = min(3, max(0, (int(number).bit_length()-1)//10 - 1))
+    if idx < 3 and number >= 999.95*_HUMAN_UNITS[idx][0]:
+        idx += 1
+    divisor, suffix = _HUMAN_UNITS[idx]
+    return f'{number/divisor:.1f}{suffix}'
+
+##############################################################################
+def make_formatter(divisor, precision, width):
+    """ Return a function to render a value per the given units; the
+    choice of format and the format specs are made here once rather
+    than on every value.
+    """
+    if not divisor:
+        spec = f'>{width}'
+        def fmt_human(value, _sign=''):
+            return format(human(value), spec)
+        return fmt_human
+    if precision:
+        spec = f'{width},.{precision}f'
+    else:
+        spec, precision = f'{width},d', None # round() to int
+    specs = (spec, '+' + spec) # indexed by whether signed
+    def fmt_number(value, sign=''):
+        return format(round(value/divisor, precision), specs[bool(sign)])
+    return fmt_number
 
 ##############################################################################
 def clamp(least, value, most):
     """ Constrain a number between to values """
     return least if least > value else most if value > most else value
 
+class ReportRow:
+    """ One line of the report; made once per field and then updated
+    in place by each report (rather than a new object per report). """
+    __slots__ = ('key', 'bit', 'zero', 'text', 'line')
+    def __init__(self, key, bit):
+        self.key, self.bit = key, bit
+        self.zero, self.text, self.line = False, '', ''
+
 class MemFo:
     """ TBD """
     singleton = None
@@ -69,46 +113,70 @@ class MemFo:
     def __init__(self, opts):
         assert not MemFo.singleton
 
-        self.mono_start = time.monotonic()
-        self.fh = open('/proc/meminfo', 'r', encoding='utf-8')
+        self.mono_start_ns = time.monotonic_ns()
+        self.fd = os.open('/proc/meminfo', os.O_RDONLY)
         self.DB = opts.DB
         self.dump = opts.dump
         self.vmalloc_total = opts.vmalloc_total
         if self.vmalloc_total:
             MemFo.max_value *= 1000
+        # fields dropped when reading /proc/meminfo
+        self.skip_keys = frozenset() if self.vmalloc_total else frozenset(
+                (b'VmallocTotal', ))
         self.zeros = opts.zeros
         self.interval = clamp(0.5, opts.interval_sec, 3600.0)
+        self.interval_ns = int(round(self.interval*NS_PER_SEC))
         self.config_basename = opts.config
 
         self.units, self.divisor, self.data_width = opts.units, 0, 0
+        self.fmt = None # value formatter for the units (set by _set_units)
+        self.render_cache = {} # (value, signed) to rendered string
         self.delta = False # whether to show deltas
         self.win = None  # PowerWindow
         self.spin = None # Option Spinner
+        self.key_handlers = {} # key to handler method (set by start_curses)
         self.page = 'normal' # or 'edit' or 'help'
         self.edit_mode = False # true in when editing
         self.help_mode = False # true in when in help screen
         self.infos = []
+        self.peaks = [] # per-field maximums of all samples
         self.loops_per_info = 1
         self.loops_fro_store = 0
+        self.sample_cnt = 0 # number of samples taken
+        self.next_sample_ns = 0 # when the next sample is due
+        self.idle_ticks = 0 # consecutive samples with no change
+        self.prev_state = None # inputs of the current report rows
         self.term_width = 0 # how wide is the terminal
         
         self.key_width = None
         self.data_width = None
-        self.report_rows = None # the stuff to display
+        self.report_rows = {} # key to ReportRow (the stuff to display)
+        self.header_rows, self.body_rows = [], [] # (line, attr) of normal page
+        self.time_str, self.time_str_secs = '', -1 # cached current time
+        self.prev_frame = None # (page, rows, cols) last drawn
+        self.dirty = True # whether the window content needs redrawing
         self._set_units()
         
-        self.non_zeros = set() # ever non-zero since program started
+        self.keys = () # field names in /proc/meminfo order (fixed by 1st read)
+        self.raw_keys = () # self.keys as read (i.e., as bytes)
+        self.key_to_idx = {} # field name to index into self.keys and bitsets
+        self.nonzero_mask = 0 # bitset of fields ever non-zero since start
         self.freezes = set()  # fields that are frozen (above the line)
         self.hides = set()    # fields that are hidden
+        self.freeze_mask = 0  # bitset parallel to self.freezes
+        self.hide_mask = 0    # bitset parallel to self.hides
         self.edit_cnt = 0     # number of pending edits
-        self.config = None
+        self.config = None    # config sections (name to set of fields)
         self.config_file = None
         self.init_config()
         
     def start_curses(self, line_cnt=200):
         """ Start window mode"""
+        global curses, Window, OptionSpinner
         if self.win:
             return
+        import curses
+        from memfo.PowerWindow import Window, OptionSpinner
         self.spin = OptionSpinner()
         self.spin.add_key('help_mode', '? - help screen',
                           vals=[False, True], obj=self)
@@ -121,11 +189,14 @@ class MemFo:
         self.spin.add_key('zeros', 'z - show all zeros lines',
                           vals=[False, True], obj=self)
 
-        keys_we_handle =  [ord('*'), ord('-'), ord('r'),
-                           curses.KEY_ENTER, 10] + list(self.spin.keys)
+        self.key_handlers = dict.fromkeys(self.spin.keys, self._on_spin_key)
+        self.key_handlers.update(dict.fromkeys(
+            (_K_STAR, _K_DASH, _K_R), self._on_edit_key))
+        self.key_handlers.update(dict.fromkeys(
+            (curses.KEY_ENTER, _K_LF), self._on_enter_key))
 
         self.win = Window(head_line=True, head_rows=line_cnt,
-                          body_rows=line_cnt, keys=keys_we_handle)
+                          body_rows=line_cnt, keys=list(self.key_handlers))
         
     def init_config(self):
         """ Get the configuration ... create if missing. """
@@ -135,16 +206,43 @@ class MemFo:
             self.edit_cnt = 1 # make it "dirty"
             self.commit_config(freezes='MemTotal MemAvailable'.split(),
                                hides='KernelStack Active(file)'.split())
-        self.config = configparser.RawConfigParser(allow_no_value=True)
-        self.config.optionxform = lambda option: option
-        self.config.read(self.config_file)
-        if 'Frozen Fields' in self.config.sections():
-            self.freezes = set(self.config['Frozen Fields'].keys())
-        if 'Hidden Fields' in self.config.sections():
-            self.hides = set(self.config['Hidden Fields'].keys())
+        # the .ini is just sections of bare field names; parse it directly
+        self.config, section = {}, None
+        try:
+            with open(self.config_file, encoding='utf-8') as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line or line[0] in '#;':
+                        continue
+                    if line.startswith('[') and line.endswith(']'):
+                        section = self.config.setdefault(line[1:-1].strip(), set())
+                    elif section is not None:
+                        section.add(line)
+        except OSError:
+            pass
+        if 'Frozen Fields' in self.config:
+            self.freezes = set(self.config['Frozen Fields'])
+        if 'Hidden Fields' in self.config:
+            self.hides = set(self.config['Hidden Fields'])
+        self._set_edit_masks()
         # print(f'{self.freezes=}')
         # print(f'{self.hides=}')
 
+    def _key_mask(self, keys):
+        """ Return the bitset of the given field names (unknowns ignored) """
+        mask = 0
+        for key in keys:
+            idx = self.key_to_idx.get(key, None)
+            if idx is not None:
+                mask |= 1 << idx
+        return mask
+
+    def _set_edit_masks(self):
+        """ Refresh the bitsets that mirror self.freezes and self.hides;
+        call whenever either set is edited. """
+        self.freeze_mask = self._key_mask(self.freezes)
+        self.hide_mask = self._key_mask(self.hides)
+
     def commit_config(self, freezes=None, hides=None):
         """ Write the config file from the current state or a given."""
         if self.edit_cnt == 0:
@@ -161,6 +259,9 @@ class MemFo:
         """ Close down window mode """
         if self.win:
             self.win.stop_curses()
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
 
     def _set_units(self):
         self.precision = 1
@@ -178,8 +279,10 @@ class MemFo:
         else: # human
             self.divisor = 0 # human
             self.precision = 0
-        self.data_width = 1
-        self.data_width = len(self.render(-self.max_value))
+        self.data_width = len(make_formatter(
+                self.divisor, self.precision, 1)(-self.max_value))
+        self.fmt = make_formatter(self.divisor, self.precision, self.data_width)
+        self.render_cache = {} # the cached strings are for the old units
         # if self.units == 'human':
          #    self.data_width = 1+min(self.data_width, 7)
     
@@ -187,29 +290,35 @@ class MemFo:
         """ Render a value into a string per the current options
             Given no value, render the max supported.
         """
-        sign = '+' if sign else ''
-        if not self.divisor:
-            string = human(value)
-            if sign and string[0] != '-':
-                string = f'+{string}'
-            rv = f'{human(value):>{self.data_width}}'
-        else:
-            value = round(value/self.divisor, self.precision)
-            if self.precision:
-                rv = f'{value:{sign}{self.data_width},.{self.precision}f}'
-            else:
-                rv = f'{int(value):{sign}{self.data_width},d}'
+        key = (value, bool(sign))
+        rv = self.render_cache.get(key, None)
+        if rv is None:
+            if len(self.render_cache) >= 4096:
+                self.render_cache.clear()
+            rv = self.render_cache[key] = self.fmt(value, sign)
         return rv
 
-    def render_slices(self, infos, count=5000):
+    def _time_str(self):
+        """ Return the current time formatted for the last column; the
+        string is remade only when the wall-clock second changes. """
+        secs = int(time.time())
+        if secs != self.time_str_secs:
+            self.time_str_secs = secs
+            self.time_str = time.strftime("%m/%d %H:%M:%S", time.localtime(secs))
+        return self.time_str
+
+    def render_slices(self, infos):
         """ TBD """
-        def add_row(key, text, zero=False):
-            nonlocal rows
-            rows[key] = SimpleNamespace(key=key, zero=zero, text=text)
+        def add_row(key, text, zero=False, bit=0):
+            row = rows.get(key, None)
+            if row is None:
+                row = rows[key] = ReportRow(key, bit)
+            row.zero, row.text = zero, text
+            row.line = text if key.startswith('_') else f'{text} {key}'
             if not zero:
-                self.non_zeros.add(key)
+                self.nonzero_mask |= bit
 
-        rows = {}
+        rows = self.report_rows
         delta = 'show-values' if self.delta else 'show-deltas'
         zeros = 'hide-if-zero' if self.zeros else 'show-if-zero'
         edit = 'exit-edit' if self.edit_mode else 'enter-edit'
@@ -220,31 +329,52 @@ class MemFo:
                     + ' *:put-on-top -:hide-line r:reset-edits  ?=help')
         add_row(key='_lead', text=text)
 
+        columns = [] # per slice, the texts of the fields (as in self.keys)
+        last_ii = len(infos)-1
         for ii, info in enumerate(infos):
-            for key in list(info.keys())[:count]:
-                if key == '_mono':
-                    ago = f'{ago_str(info["_mono"]-self.mono_start)}'
-                    text = f'{ago:>{self.data_width}}'
-                    if ii == len(infos)-1:
-                        time_str = datetime.now().strftime("%m/%d %H:%M:%S")
-                        text += f' {time_str}'
-                else:
-                    val = info[key]
-                    if ii < len(infos)-1 and self.delta:
-                        next_val = infos[ii+1][key]
-                        text = self.render(next_val-val, sign=True)
-                    else:
-                        text = self.render(val)
-                # now add the text of the file to the text of the line
-                if key in rows:
-                    rows[key].text += ' ' + text
-                elif key.startswith('_') or key in self.non_zeros:
-                    add_row(key, text)
-                else:
-                    peak = max([info[key] for info in infos])
-                    add_row(key, text, zero=bool(peak==0))
-        self.report_rows = rows
-            
+            is_last = bool(ii == last_ii)
+            ago = ago_str((info[_MONO]-self.mono_start_ns) // NS_PER_SEC)
+            text = f'{ago:>{self.data_width}}'
+            if is_last:
+                text += f' {self._time_str()}'
+            # format all the values of the slice in one pass
+            if self.delta and not is_last:
+                deltas = map(operator.sub, infos[ii+1], info)
+                texts = map(self.render, islice(deltas, 1, None), repeat(True))
+            else:
+                texts = map(self.render, islice(info, 1, None))
+            columns.append([text, *texts])
+
+        # now the texts of each field (across the slices) make its line
+        for idx, (key, texts) in enumerate(zip(self.keys, zip(*columns))):
+            text = ' '.join(texts)
+            if idx == _MONO:
+                add_row(key, text)
+            elif self.nonzero_mask & (1 << idx):
+                add_row(key, text, bit=1<<idx)
+            else:
+                add_row(key, text, zero=bool(self.peaks[idx]==0), bit=1<<idx)
+        if self.win: # (a dump just prints the rows)
+            self._partition_rows()
+
+    def _partition_rows(self):
+        """ Sort the report rows into the lines of the normal page: the
+        header (the lead rows, then the frozen rows) and the body (the not
+        hidden or zero rows); redo whenever the rows, the zeros option or
+        the edits change. """
+        lead_rows, frozen_rows, body_rows = [], [], []
+        for row in self.report_rows.values():
+            if row.key.startswith('_'):
+                lead_rows.append((row.line, curses.A_BOLD))
+            elif self.freeze_mask & row.bit:
+                frozen_rows.append((row.line, None))
+            elif not self.zeros and row.zero:
+                continue
+            elif not self.hide_mask & row.bit:
+                body_rows.append((row.line, None))
+        self.header_rows = lead_rows + frozen_rows
+        self.body_rows = body_rows
+
     def _append_info(self, info):
         """ Add and compress memory in a pattern like:
         ['0s']
@@ -269,6 +399,9 @@ class MemFo:
         """
         MAX_INFOS = 8
         MAX_INFOS = 128
+        # running per-field peaks of every sample (so no scan per redraw)
+        self.peaks = list(map(max, self.peaks, info)) if self.peaks else list(info)
+
         if not self.infos:
             self.infos.append(info)
             self.loops_fro_store = 0
@@ -281,60 +414,113 @@ class MemFo:
         
         else:
             if len(self.infos) >= 2:
-                floor_s = self.interval*self.loops_per_info * 0.95
-                ceiling_s = self.interval*self.loops_per_info * 1.05
-                delta_s = info['_mono'] - self.infos[-2]['_mono']
+                bucket_ns = self.interval_ns*self.loops_per_info
+                floor_ns = bucket_ns * 95 // 100
+                ceiling_ns = bucket_ns * 105 // 100
+                delta_ns = info[_MONO] - self.infos[-2][_MONO]
             else:
-                floor_s = ceiling_s = delta_s = 0
+                floor_ns = ceiling_ns = delta_ns = 0
 
             self.infos[-1] = info
             self.loops_fro_store += 1
-            if delta_s > ceiling_s:
+            if delta_ns > ceiling_ns:
                 # been here too long even though the count does
                 # not indicate that ... force bucket close
                 self.loops_fro_store = self.loops_per_info
 
             if self.loops_fro_store >= self.loops_per_info:
-                if delta_s < floor_s:
+                if delta_ns < floor_ns:
                     # time says we should not close the bucket
                     self.loops_fro_store -= 1
                 else:
                     self.loops_fro_store = 0
                     if len(self.infos) > MAX_INFOS:
-                        self.infos = [self.infos[i]
-                                   for i in range(0, MAX_INFOS+1, 2)]
+                        # drop every other sample in place (keeps the
+                        # first and the last as the list has odd length)
+                        del self.infos[1::2]
                         self.loops_per_info *= 2
 
-        # print([ago_str(info['_mono']-self.mono_zero) for info in self.infos])
+        # print([ago_str((info[_MONO]-self.mono_start_ns)//NS_PER_SEC)
+        #        for info in self.infos])
 
     def _read_info(self):
-        self.fh.seek(0)
-        info = {'_mono': time.monotonic()}
-        for line in self.fh:
-            mat = re.match(r'^([^:]+):\s*(\d+)\s*(|kB)$', line)
-            if mat:
-                key, val, suffix = mat.group(1), int(mat.group(2)), mat.group(3)
-                if key == 'VmallocTotal' and not self.vmalloc_total:
+        """ Sample /proc/meminfo into a compact array of values aligned
+        with self.keys (rather than a dict per sample). """
+        # one pread() of the whole file (vs seek + buffered line reads);
+        # parsed as bytes since the field names need decoding just once
+        buf = os.pread(self.fd, 8192, 0)
+        keys, vals = [b'_mono'], [time.monotonic_ns()]
+        for line in buf.splitlines():
+            # lines are like b'MemTotal:       16318632 kB' (or w/o the 'kB')
+            key, _, rest = line.partition(b':')
+            if key in self.skip_keys:
+                continue
+            parts = rest.split()
+            if not parts or not parts[0].isdigit():
+                continue
+            val = int(parts[0])
+            if len(parts) > 1:
+                if len(parts) > 2 or parts[1] != b'kB':
                     continue
-                val *= 1024 if suffix == 'kB' else 1
-                info[key] = val
-        if not self.key_width:
-            self.key_width = max([len(k) for k in info])
+                val *= 1024
+            keys.append(key)
+            vals.append(val)
+        if not self.keys:
+            self.raw_keys = tuple(keys)
+            self.keys = tuple(k.decode('ascii') for k in keys)
+            self.key_width = max(map(len, self.keys))
+            self.key_to_idx = {k: i for i, k in enumerate(self.keys)}
+            self._set_edit_masks()
+        elif tuple(keys) != self.raw_keys:
+            # the fields changed (unexpected) ... align to the first read
+            by_key = dict(zip(keys, vals))
+            vals = [by_key.get(key, 0) for key in self.raw_keys]
 
         # if self.DB:
             # self.dump_infos([info])
-        return info
+        return array('q', vals)
     
+    def _schedule_sample(self, now_ns):
+        """ Set when the next sample is due: the next interval boundary
+        (relative to the start) or, once nothing has changed for several
+        samples, a boundary up to 5s out (doubling per idle sample). """
+        step_ns = self.interval_ns
+        if self.idle_ticks > 5:
+            step_ns = min(step_ns << min(self.idle_ticks-5, 16),
+                          max(step_ns, 5*NS_PER_SEC))
+            step_ns -= step_ns % self.interval_ns # stay on the boundaries
+        elapsed_ns = now_ns - self.mono_start_ns
+        self.next_sample_ns = (self.mono_start_ns + step_ns - self.interval_ns
+                + self.interval_ns * (elapsed_ns // self.interval_ns + 1))
+
     def update_report_data(self):
-        """ Get new data and report on it. """
-        info = self._read_info()
-        self._append_info(info)
-        self.term_width, _ = shutil.get_terminal_size()
+        """ Get new data (if a sample is due) and report on it. """
+        now_ns = time.monotonic_ns()
+        if now_ns >= self.next_sample_ns: # else woken early by a key
+            info = self._read_info()
+            if self.infos and info[_MONO+1:] == self.infos[-1][_MONO+1:]:
+                self.idle_ticks += 1
+            else:
+                self.idle_ticks = 0
+            self._append_info(info)
+            self.sample_cnt += 1
+            self._schedule_sample(now_ns)
+        if self.win: # curses tracks resizes (via SIGWINCH) for us
+            self.term_width = self.win.cols
+        else:
+            self.term_width, _ = shutil.get_terminal_size()
         cols_width = self.term_width - self.key_width
         if self.page == 'edit':
             cols_width -= 4  # for ' ** '
         col_cnt = max(1, cols_width//(1+self.data_width))
-        
+
+        state = (self.sample_cnt, col_cnt, self.units, self.delta,
+                 self.zeros, self.page)
+        if state == self.prev_state:
+            return # the report rows would be the same
+        self.prev_state = state
+        self.dirty = True
+
         if len(self.infos) <= col_cnt:
             slices = self.infos
         else:
@@ -345,129 +531,153 @@ class MemFo:
             slices.append(self.infos[-1])
         self.render_slices(slices)
 
+    def _clear_window(self):
+        """ Clear the window for the next frame; only a new page or size
+        needs a full repaint, else curses sends just the changed cells. """
+        frame = (self.page, self.win.rows, self.win.cols)
+        self.win.clear(full=bool(frame != self.prev_frame))
+        self.prev_frame = frame
+
     def render_help_screen(self):
         """Populate help screen"""
-        self.win.clear()
+        self._clear_window()
         self.win.add_header(
                 "-- HELP SCREEN ['?' or ENTER closes Help; Ctrl-C exits ] --",
                  attr=curses.A_BOLD)
         self.spin.show_help_nav_keys(self.win)
         self.spin.show_help_body(self.win)
-        self.win.render()
 
         
     def render_normal_report(self):
         """ TBD"""
-        self.win.clear()
-        for row in self.report_rows.values():
-            if row.key.startswith('_'):
-                self.win.add_header(row.text, attr=curses.A_BOLD)
-            elif row.key in self.freezes:
-                self.win.add_header(f'{row.text} {row.key}')
-            elif not self.zeros and row.zero:
-                continue
-            elif row.key not in self.hides:
-                self.win.add_body(f'{row.text} {row.key}')
-        self.win.render()
+        self._clear_window()
+        for line, attr in self.header_rows:
+            self.win.add_header(line, attr=attr)
+        for line, attr in self.body_rows:
+            self.win.add_body(line, attr=attr)
 
     def render_edit_report(self):
         """ TBD"""
         def text(row, flag):
             return f'{row.text} {flag} {row.key}'
 
-        self.win.clear()
+        self._clear_window()
         for row in self.report_rows.values():
             if row.key.startswith('_'):
                 self.win.add_header(row.text)
-            elif row.key in self.freezes:
+            elif self.freeze_mask & row.bit:
                 self.win.add_body(text(row, '***'))
-            elif row.key in self.hides:
+            elif self.hide_mask & row.bit:
                 self.win.add_body(text(row, '---'))
             else:
                 self.win.add_body(text(row, '   '))
-        self.win.render()
         
-    def do_window(self):
-        """ one loop of window rendering """
-        def set_page():
-            if self.help_mode:
-                self.page = 'help'
-                self.win.set_pick_mode(False)
-                self.commit_config()
-            elif self.edit_mode:
-                self.page = 'edit'
-                self.win.set_pick_mode(True)
+    def _set_page(self):
+        """ Choose the page per the current modes """
+        if self.help_mode:
+            self.page = 'help'
+            self.win.set_pick_mode(False)
+            self.commit_config()
+        elif self.edit_mode:
+            self.page = 'edit'
+            self.win.set_pick_mode(True)
+        else:
+            self.page = 'normal'
+            self.win.set_pick_mode(False)
+            self.commit_config()
+
+    def _on_spin_key(self, key):
+        """ Handle an option key (the spinner rotates the value) """
+        self.spin.do_key(key, self.win)
+        if key == _K_U:
+            self._set_units()
+        elif key in (_K_QUEST, _K_E):
+            self._set_page()
+
+    def _on_edit_key(self, key):
+        """ Handle a freeze/hide/reset key (only effective on the edit page) """
+        if self.page != 'edit':
+            return
+        row = list(self.report_rows.values())[self.win.pick_pos+2]
+        param = row.key
+        if key == _K_STAR:
+            if param in self.freezes:
+                self.freezes.discard(param)
+            else:
+                self.freezes.add(param)
+            self.hides.discard(param)
+        elif key == _K_DASH:
+            if param in self.hides:
+                self.hides.discard(param)
             else:
-                self.page = 'normal'
-                self.win.set_pick_mode(False)
-                self.commit_config()
-            
-        def do_key(key):
-#           # ENSURE keys are in 'keys_we_handle'
-#           if key in (ord('/'), ):
-#               pass
-            if key in self.spin.keys:
-                self.spin.do_key(key, self.win)
-                if key in (ord('u'), ):
-                    self._set_units()
-                elif key in (ord('?'), ):
-                    set_page()
-
-                elif key in (ord('e'), ):
-                    set_page()
-
-            elif key in (ord('*'), ord('-'), ord('r') ):
-                if self.page in ('edit', ):
-                    row = list(self.report_rows.values())[self.win.pick_pos+2]
-                    param = row.key
-                    if key == ord('*'):
-                        if param in self.freezes:
-                            self.freezes.discard(param)
-                        else:
-                            self.freezes.add(param)
-                        self.hides.discard(param)
-                    elif key == ord('-'):
-                        if param in self.hides:
-                            self.hides.discard(param)
-                        else:
-                            self.hides.add(param)
-                        self.freezes.discard(param)
-                    elif key == ord('r'):
-                        self.hides, self.freezes = set(), set()
-                    self.edit_cnt += 1
-                    if key in (ord('*'), ord('-'), ):
-                        self.win.last_pick_pos = self.win.pick_pos
-                        self.win.pick_pos = min(
-                            self.win.pick_pos+1, self.win.body.row_cnt-1)
-
-            elif key in (curses.KEY_ENTER, 10):
-                if self.help_mode:
-                    self.help_mode = False
-                elif self.edit_mode:
-                    self.edit_mode = False
-                set_page()
+                self.hides.add(param)
+            self.freezes.discard(param)
+        elif key == _K_R:
+            self.hides, self.freezes = set(), set()
+        self._set_edit_masks()
+        self._partition_rows()
+        self.edit_cnt += 1
+        if key in (_K_STAR, _K_DASH):
+            self.win.last_pick_pos = self.win.pick_pos
+            self.win.pick_pos = min(
+                self.win.pick_pos+1, self.win.body.row_cnt-1)
+
+    def _on_enter_key(self, _key):
+        """ Handle ENTER (leaves help or edit mode) """
+        if self.help_mode:
+            self.help_mode = False
+        elif self.edit_mode:
+            self.edit_mode = False
+        self._set_page()
+
+    def do_key(self, key):
+        """ Dispatch a key returned by the window (None if timed out);
+        keys must be in self.key_handlers to be returned at all. """
+        handler = self.key_handlers.get(key, None)
+        if handler:
+            handler(key)
+            self.dirty = True
+            if self.idle_ticks: # user is active; resume the normal pace
+                self.idle_ticks = 0
+                self._schedule_sample(time.monotonic_ns())
 
+    def do_window(self):
+        """ one loop of window rendering """
         self.start_curses()
 
-        if self.page == 'help':
-            self.render_help_screen()
-        elif self.page == 'edit':
-            self.render_edit_report()
-        else: # normal mode
-            self.render_normal_report()
-        do_key(self.win.prompt(seconds=self.interval))
+        # redraw only if the content or the screen changed; otherwise,
+        # what is on the screen (and in the pads for scrolling) is current
+        frame = (self.page, self.win.rows, self.win.cols)
+        if self.dirty or frame != self.prev_frame:
+            if self.page == 'help':
+                self.render_help_screen()
+            elif self.page == 'edit':
+                self.render_edit_report()
+            else: # normal mode
+                self.render_normal_report()
+            self.win.render() # the one screen update for the frame
+            self.dirty = False
+
+        # sleep until the next sample is due (on an interval boundary
+        # relative to the start) so the samples do not drift by the time
+        # spent in each loop
+        pause_ns = max(0, self.next_sample_ns - time.monotonic_ns())
+        self.do_key(self.win.prompt(seconds=pause_ns/NS_PER_SEC))
 
     def loop(self):
         """ The main loop for the program """
+        if not self.dump:
+            self.start_curses()
         while True:
             self.update_report_data()
 
             if self.dump:
-                texts = [f'{row.text} {row.key}' for row in self.report_rows.values()
+                texts = [row.line for row in self.report_rows.values()
                          if not row.key.startswith('_')]
                 print('\n' + '\n'.join(texts) + '\n')
                 if self.DB:
-                    print([ago_str(info['_mono']-self.mono_start) for info in slices])
+                    print([ago_str((info[_MONO]-self.mono_start_ns)//NS_PER_SEC)
+                           for info in self.infos])
                 time.sleep(self.interval)
                 break
             else: